@@ -1,79 +1,211 @@
 
 from datetime import datetime
-from functools import wraps
+from functools import lru_cache, wraps
+import atexit
+import io
 import os
 from logging import Logger, Handler
 
 import logging
+import logging.handlers
+import queue
 import shutil
-
-from colored import Fore as fg
-from colored import Back as bg
-from colored import Style as st
+import sys
+import time
 
 from pathlib import Path
 
 datefmt = "%Y-%m-%d %H:%M:%S"
 
+# -- ANSI escapes, inlined so importing the plugin doesn't pay -- #
+#    for the colored package at pytest startup
+_CYAN       = "\x1b[36m"
+_WHITE      = "\x1b[37m"
+_YELLOW     = "\x1b[33m"
+_RED        = "\x1b[31m"
+_GREEN      = "\x1b[32m"
+_LIGHT_GRAY = "\x1b[38;5;252m"
+_RESET      = "\x1b[0m"
+
 levels = {
-    "debug"     : {"level": logging.DEBUG, "color": fg.CYAN},
-    "info"      : {"level": logging.INFO, "color": fg.WHITE},
-    "warning"   : {"level": logging.WARNING, "color": fg.YELLOW},
-    "error"     : {"level": logging.ERROR, "color": fg.RED},
-    "critical"  : {"level": logging.CRITICAL, "color": fg.RED},
-    "step"      : {"level": 21, "color": fg.WHITE},
-    "substep"   : {"level": 22, "color": fg.light_gray},
-    "pass"      : {"level": 23, "color": fg.GREEN},
-    "fail"      : {"level": 31, "color": fg.RED},
+    "debug"     : {"level": logging.DEBUG, "color": _CYAN},
+    "info"      : {"level": logging.INFO, "color": _WHITE},
+    "warning"   : {"level": logging.WARNING, "color": _YELLOW},
+    "error"     : {"level": logging.ERROR, "color": _RED},
+    "critical"  : {"level": logging.CRITICAL, "color": _RED},
+    "step"      : {"level": 21, "color": _WHITE},
+    "substep"   : {"level": 22, "color": _LIGHT_GRAY},
+    "pass"      : {"level": 23, "color": _GREEN},
+    "fail"      : {"level": 31, "color": _RED},
 }
 
 # -- Reverse lookup ------------------------------------------- #
 levels_by_value = {v["level"]: k for k, v in levels.items()}
 
+# -- Level ints bound once at import time --------------------- #
+_DEBUG_LEVEL    = levels["debug"]["level"]
+_INFO_LEVEL     = levels["info"]["level"]
+_WARNING_LEVEL  = levels["warning"]["level"]
+_ERROR_LEVEL    = levels["error"]["level"]
+_STEP_LEVEL     = levels["step"]["level"]
+_SUBSTEP_LEVEL  = levels["substep"]["level"]
+_PASS_LEVEL     = levels["pass"]["level"]
+_FAIL_LEVEL     = levels["fail"]["level"]
+
+# -- Register custom levels once, at import time -------------- #
+# addLevelName takes the logging module lock, so it must stay out
+# of the per-handler construction path
+for _name, _info in levels.items():
+    logging.addLevelName(_info["level"], _name.upper())
+del _name, _info
+
+# -- Skip unused LogRecord fields ----------------------------- #
+# The formatters only reference asctime/levelname/message/step, so
+# don't pay current_thread()/getpid() lookups on every record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+
+# -- Parent directories already created this session ---------- #
+_created_dirs : set = set()
+
+
+def _format_message(args: tuple, sep: str, end: str) -> str:
+    # Fast path for the common single-argument call
+    if len(args) == 1 and sep == ' ' and end == '':
+        arg = args[0]
+        return arg if type(arg) is str else str(arg)
+    return sep.join(map(str, args)) + end
+
 
 
 class BlockAllFilter(logging.Filter):
     def filter(self, record):
         return False
 
+class StepFilter(logging.Filter):
+    # Injects the current step tag into records once they have passed the
+    # level check, so log calls don't allocate an extra dict per record
+
+    def __init__(self):
+        super().__init__()
+        self.current = ""
+
+    def filter(self, record):
+        record.step = self.current
+        return True
+
 class ColorFormatter(logging.Formatter):
 
-    RESET = st.RESET
+    RESET = _RESET
 
-    def __init__(self, fmt: str = None, datefmt: str = None, style='%'):
+    def __init__(self, fmt: str = None, datefmt: str = None, style='%', color: bool | None = None):
         if fmt is None:
             fmt = "[%(asctime)s] %(levelname)-8s %(message)s"
 
-        # Register custom levels
-        logging.addLevelName(levels['step']['level'], "STEP")
-        logging.addLevelName(levels['substep']['level'], "SUBSTEP")
-        logging.addLevelName(levels['pass']['level'], "PASS")
-        logging.addLevelName(levels['fail']['level'], "FAIL")
+        # -- Skip ANSI escapes when piped or NO_COLOR is set ------------ #
+        if color is None:
+            color = sys.stderr.isatty() and "NO_COLOR" not in os.environ
+        self._color_enabled = color
+
+        # -- Per-level prefix with the substep indent folded in --------- #
+        if self._color_enabled:
+            self._prefix = {
+                info["level"]: info["color"] + ("   " if name == "substep" else "")
+                for name, info in levels.items()
+            }
+            self._suffix = self.RESET
+        else:
+            self._prefix = {levels["substep"]["level"]: "   "}
+            self._suffix = ""
+
+        # -- Last (second, formatted asctime) pair ---------------------- #
+        self._ts_cache = (-1, "")
 
         super().__init__(fmt, datefmt, style)
 
-    def __get_level_by_value(self, target_level: int) -> tuple:
-        key = levels_by_value.get(target_level)
-        return (key, levels[key]) if key else (None, None)
+    def formatTime(self, record, datefmt=None):
+        # Every record within the same second shares the timestamp string,
+        # so strftime runs once per second instead of once per record
+        sec = int(record.created)
+        cached_sec, cached_str = self._ts_cache
+        if cached_sec == sec:
+            return cached_str
+
+        formatted = time.strftime(
+            datefmt or self.default_time_format, time.localtime(sec)
+        )
+        self._ts_cache = (sec, formatted)
+        return formatted
 
     def format(self, record):
-        # Get original formatted message
-        formatted = super().format(record)
+        # Wrap the entire line in the precomputed color prefix, then reset
+        prefix = self._prefix.get(record.levelno, "")
+        return prefix + super().format(record) + self._suffix
+
+
+class BufferedFileHandler(logging.FileHandler):
+    # FileHandler flushes the stream on every emit; this variant writes
+    # through a 64 KiB userspace buffer and only flushes for error-or-
+    # worse records. close() (and logging.shutdown at exit) drains it.
+
+    BUFFER_SIZE = 64 * 1024
+
+    def _open(self):
+        return io.TextIOWrapper(
+            open(self.baseFilename, self.mode + "b", buffering=self.BUFFER_SIZE),
+            encoding=self.encoding,
+            write_through=False
+        )
 
-        # Get level info using reverse lookup
-        level_key, level_info = self.__get_level_by_value(record.levelno)
-        color = level_info["color"] if level_info else self.RESET
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
 
-        # Add indentation for substep
-        if level_key == "substep":
-            formatted = "   " + formatted
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= _ERROR_LEVEL:
+                self.flush()
+        except Exception:
+            self.handleError(record)
 
-        # Wrap the entire line in color, then reset
-        return f"{color}{formatted}{self.RESET}"
+
+@lru_cache(maxsize=8)
+def _get_color_formatter(fmt: str, datefmt: str) -> ColorFormatter:
+    return ColorFormatter(fmt=fmt, datefmt=datefmt)
+
+
+@lru_cache(maxsize=8)
+def _get_file_formatter(fmt: str, datefmt: str) -> logging.Formatter:
+    return logging.Formatter(fmt=fmt, datefmt=datefmt)
 
 
 class TestLogger:
-    
+
+    # Slotted so the hot self.__xxx reads in the log methods are C-level
+    # offset loads instead of instance-dict lookups
+    __slots__ = (
+        "__logger",
+        "__step_filter",
+        "__call_file_handler",
+        "__setup_file_handler",
+        "__setup_queue_handler",
+        "__setup_queue_listener",
+        "__term_handler",
+        "__steps_file_handler",
+        "__combined_file_handler",
+        "__term_format",
+        "__setup_format",
+        "__term_config_loglevel",
+        "__term_setup_loglevel",
+        "__term_call_loglevel",
+        "__setup_file_loglevel",
+        "__call_file_loglevel",
+        "stepn",
+        "substepn",
+    )
+
     def __init__(
         self, 
         logger_name: str = "test_logger",
@@ -87,14 +219,25 @@ class TestLogger:
                 - term_config_loglevel
                 - term_setup_loglevel
                 - term_call_loglevel
+                - propagate
         """
         self.__logger : Logger = logging.getLogger( logger_name )
-        self.__logger.setLevel(levels['info']['level'])
+        self.__logger.setLevel(_INFO_LEVEL)
+        # Don't walk up to the root logger (and whatever handlers pytest
+        # hung there) for every record
+        self.__logger.propagate = kwargs.get('propagate', False)
+
+        # -- Filter providing %(step)s to the formatters ----------- #
+        self.__step_filter : StepFilter = StepFilter()
+        self.__logger.addFilter( self.__step_filter )
 
         # -- Handler for the test call file ----------------------- #
         self.__call_file_handler     : Handler = None
         # -- Handler for the test setup file ---------------------- #
         self.__setup_file_handler    : Handler = None
+        # -- Queue front-end and writer thread for the setup file -- #
+        self.__setup_queue_handler   : Handler = None
+        self.__setup_queue_listener  : logging.handlers.QueueListener = None
         # -- Handler for the test prompt -------------------------- #
         self.__term_handler          : Handler = None
         # -- Handler for the steps file  -------------------------- #
@@ -111,22 +254,22 @@ class TestLogger:
         #   Every other entry is logged into the files always (for now)
 
         # -- Applied during the test configuration ------------------ #
-        self.__term_config_loglevel : int = kwargs.get('term_config_loglevel', levels['info']["level"])
+        self.__term_config_loglevel : int = kwargs.get('term_config_loglevel', _INFO_LEVEL)
         # -- Applied during the setup stage ------------------------ #
-        self.__term_setup_loglevel  : int = kwargs.get('term_setup_loglevel', levels['info']["level"])
+        self.__term_setup_loglevel  : int = kwargs.get('term_setup_loglevel', _INFO_LEVEL)
         # -- Applied during the call stage ------------------------- #
-        self.__term_call_loglevel   : int = kwargs.get('term_call_loglevel', levels['info']["level"])
+        self.__term_call_loglevel   : int = kwargs.get('term_call_loglevel', _INFO_LEVEL)
     
         # -- Applied during the test configuration ------------------ #
-        self.__setup_file_loglevel : int = kwargs.get('setup_file_loglevel', levels['info']["level"])
+        self.__setup_file_loglevel : int = kwargs.get('setup_file_loglevel', _INFO_LEVEL)
         # -- Applied during the setup stage ------------------------ #
-        self.__call_file_loglevel  : int = kwargs.get('call_file_loglevel', levels['info']["level"])
+        self.__call_file_loglevel  : int = kwargs.get('call_file_loglevel', _INFO_LEVEL)
 
 
         # -- Step count for the step log --------------------------- #
-        self.__stepn    : int = 0
+        self.stepn    : int = 0
         # -- The substep one --------------------------------------- #
-        self.__substepn : int = 0
+        self.substepn : int = 0
     
     @property
     def logger(self) -> Logger:
@@ -156,14 +299,6 @@ class TestLogger:
     def term_call_loglevel(self, value: int) -> None:
         self.__term_call_loglevel = value
 
-    @property
-    def stepn(self) -> int:
-        return self.__stepn
-
-    @property
-    def substepn(self) -> int:
-        return self.__substepn
-
     def __add_handler(self, handler: Handler) -> None:
         self.__logger.addHandler( handler )
 
@@ -171,11 +306,16 @@ class TestLogger:
         self.__logger.removeHandler( handler )
 
     def __create_file_handler(self, filepath: str, encoding: str = "utf-8") -> Handler:
-        return logging.FileHandler(filename=filepath, encoding=encoding)
+        # Buffered so the test thread doesn't pay one write+flush syscall
+        # per line; errors flush immediately, close drains the buffer
+        return BufferedFileHandler(filename=filepath, encoding=encoding)
 
     def __ensure_path(self, path: str | Path) -> None:
-        path = Path(path)
-        path.parent.mkdir(parents=True, exist_ok=True)
+        # Skip the stat/mkdir syscalls for parents we already created
+        parent = os.path.dirname(os.fspath(path))
+        if parent and parent not in _created_dirs:
+            os.makedirs(parent, exist_ok=True)
+            _created_dirs.add(parent)
 
     def init_term_handler(
         self,
@@ -188,10 +328,10 @@ class TestLogger:
         if fmt is not None:
             self.__term_format = fmt
 
-        self.__term_handler = logging.StreamHandler()
+        self.__term_handler = logging.StreamHandler(sys.stderr)
         self.__term_handler.setLevel( self.__term_config_loglevel )
         self.__term_handler.setFormatter(
-            ColorFormatter(fmt=self.__term_format, datefmt=datefmt)
+            _get_color_formatter(self.__term_format, datefmt)
         )
         
         self.__add_handler( self.__term_handler )
@@ -211,15 +351,42 @@ class TestLogger:
 
         self.__ensure_path( path )
 
+        # -- Drop any handler left over from a previous test ------------ #
+        self.close_setup_logger()
+
         # -- Configure a new File Handler ------------------------------- #
         self.__setup_file_handler = self.__create_file_handler(path)
         self.__setup_file_handler.setLevel( self.__setup_file_loglevel )
         self.__setup_file_handler.setFormatter(
-            logging.Formatter(fmt=self.__setup_format, datefmt=datefmt)
+            _get_file_formatter(self.__setup_format, datefmt)
         )
 
-        # -- Add the handler to the global logger ----------------------- #
-        self.logger.addHandler( self.__setup_file_handler )
+        # -- Writes happen on a background thread: the logger only ------ #
+        #    enqueues, the listener owns the file handler
+        log_queue = queue.SimpleQueue()
+        self.__setup_queue_listener = logging.handlers.QueueListener(
+            log_queue, self.__setup_file_handler, respect_handler_level=True
+        )
+        self.__setup_queue_listener.start()
+
+        self.__setup_queue_handler = logging.handlers.QueueHandler( log_queue )
+        self.__setup_queue_handler.setLevel( self.__setup_file_loglevel )
+        self.logger.addHandler( self.__setup_queue_handler )
+
+    def close_setup_logger(self):
+        if self.__setup_file_handler is None:
+            return
+
+        # -- Detach and close so handlers don't pile up per test -------- #
+        self.__remove_handler( self.__setup_queue_handler )
+        self.__setup_queue_handler = None
+
+        # Stopping the listener drains the queue before the join returns
+        self.__setup_queue_listener.stop()
+        self.__setup_queue_listener = None
+
+        self.__setup_file_handler.close()
+        self.__setup_file_handler = None
 
     def configure_term_logger_setup(self):
         self.__term_handler.setLevel( self.__term_setup_loglevel )
@@ -230,67 +397,97 @@ class TestLogger:
 
 
     def debug(self, *args, sep=' ', end='', enable=True, **kwargs):
-        extra = {"step": ""}
+        if not (enable and args):
+            return
+
+        if not self.__logger.isEnabledFor(_DEBUG_LEVEL):
+            return
 
-        if enable and args:
-            msg = sep.join(str(a) for a in args) + end
-            self.__logger.debug(msg, **kwargs, extra=extra)
+        msg = _format_message(args, sep, end)
+        self.__logger.debug(msg, **kwargs)
 
     def info(self, *args, sep=' ', end='', enable=True, **kwargs):
-        extra = {"step": ""}
+        if not (enable and args):
+            return
 
-        if enable and args: 
-            msg = sep.join(str(a) for a in args) + end
-            # Correctly call the logger.info method
-            self.__logger.info(msg, **kwargs, extra=extra)
+        if not self.__logger.isEnabledFor(_INFO_LEVEL):
+            return
+
+        msg = _format_message(args, sep, end)
+        self.__logger.info(msg, **kwargs)
 
     def warning(self, *args, sep=' ', end='', enable=True, **kwargs):
-        extra = {"step": ""}
+        if not (enable and args):
+            return
+
+        if not self.__logger.isEnabledFor(_WARNING_LEVEL):
+            return
 
-        if enable and args:  
-            msg = sep.join(str(a) for a in args) + end
-            self.__logger.warning(msg, **kwargs, extra=extra)
+        msg = _format_message(args, sep, end)
+        self.__logger.warning(msg, **kwargs)
 
     def error(self, *args, sep=' ', end='', enable=True, **kwargs):
-        extra = {"step": ""}
+        if not (enable and args):
+            return
+
+        if not self.__logger.isEnabledFor(_ERROR_LEVEL):
+            return
 
-        if enable and args:  
-            msg = sep.join(str(a) for a in args) + end
-            # Correctly call the logger.info method
-            self.__logger.error(msg, **kwargs, extra=extra)
+        msg = _format_message(args, sep, end)
+        self.__logger.error(msg, **kwargs)
 
     def passed(self, *args, sep=' ', end='', enable=True, **kwargs):
-        extra = {"step": ""}
+        if not (enable and args):
+            return
 
-        if enable and args: 
-            msg = sep.join(str(a) for a in args) + end
-            # Correctly call the logger.info method
-            self.__logger._log(levels["pass"], msg, (), **kwargs, extra=extra)
+        if not self.__logger.isEnabledFor(_PASS_LEVEL):
+            return
+
+        msg = _format_message(args, sep, end)
+        self.__logger._log(_PASS_LEVEL, msg, (), **kwargs)
 
     def fail(self, *args, sep=' ', end='', enable=True, **kwargs):
-        extra = {"step": ""}
+        if not (enable and args):
+            return
+
+        if not self.__logger.isEnabledFor(_FAIL_LEVEL):
+            return
+
+        msg = _format_message(args, sep, end)
+        self.__logger._log(_FAIL_LEVEL, msg, (), **kwargs)
 
-        if enable and args:
-            msg = sep.join(str(a) for a in args) + end
-            self.__logger._log(levels["fail"]["level"], msg, (), **kwargs, extra=extra)
-    
     def step(self, *args, sep=' ', end='', enable=True, **kwargs):
         self.stepn += 1
         self.substepn = 0
-        extra = {"step": f" {self.stepn}"}
 
-        if enable and args:  # Only log if enabled and there are arguments
-            msg = sep.join(str(a) for a in args) + end
-            # Correctly call the logger.info method
-            self.__logger._log(levels["step"]["level"], msg, (), **kwargs, extra=extra)
+        if not (enable and args):  # Only log if enabled and there are arguments
+            return
+
+        if not self.__logger.isEnabledFor(_STEP_LEVEL):
+            return
+
+        msg = _format_message(args, sep, end)
+        self.__step_filter.current = f" {self.stepn}"
+        self.__logger._log(_STEP_LEVEL, msg, (), **kwargs)
+        self.__step_filter.current = ""
 
     def substep(self, *args, sep=' ', end='', enable=True, **kwargs):
         self.substepn += 1
-        extra = {"step": f" {self.stepn}.{self.substepn}"}
 
-        if enable and args:  # Only log if enabled and there are arguments
-            msg = sep.join(str(a) for a in args) + end
-            self.__logger._log(levels["substep"]["level"], msg, (), **kwargs, extra=extra)
+        if not (enable and args):  # Only log if enabled and there are arguments
+            return
+
+        if not self.__logger.isEnabledFor(_SUBSTEP_LEVEL):
+            return
+
+        msg = _format_message(args, sep, end)
+        self.__step_filter.current = f" {self.stepn}.{self.substepn}"
+        self.__logger._log(_SUBSTEP_LEVEL, msg, (), **kwargs)
+        self.__step_filter.current = ""
+
 
+log : TestLogger = TestLogger()
 
-log : TestLogger = TestLogger()
\ No newline at end of file
+# Flush and stop any live setup file machinery if the session dies
+# before the teardown hook runs
+atexit.register(log.close_setup_logger)
\ No newline at end of file